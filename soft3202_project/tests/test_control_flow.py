@@ -0,0 +1,24 @@
+import unittest
+from pathlib import Path
+
+from tutorial4.control_flow import cfg, visualize_cfg
+
+CFG_FILE = Path(__file__).resolve().parent.parent / "tutorial4" / "cfg"
+
+
+class VisualizeCfgTest(unittest.TestCase):
+    def test_matches_checked_in_cfg(self):
+        self.assertEqual(visualize_cfg(cfg),
+                         CFG_FILE.read_text(encoding="utf-8"))
+
+    def test_quotes_ids(self):
+        self.assertEqual(visualize_cfg({'say "hi"': ["x"]}), (
+            'digraph {\n'
+            '\t"say \\"hi\\"" [label="say \\"hi\\""]\n'
+            '\t"say \\"hi\\"" -> "x"\n'
+            '}\n'
+        ))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,41 @@
+import random
+import re
+import unittest
+
+from tutorial4.math_express import expression, number
+
+
+class ExpressionTest(unittest.TestCase):
+    def test_builds_arithmetic_expressions(self):
+        random.seed(0)
+        texts = [expression() for _ in range(200)]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertRegex(text, r"^[0-9()]+( [-+*/] [0-9()]+)+$")
+                self.assertEqual(text.count("("), text.count(")"))
+        # Every operator and both kinds of factor get picked
+        used = set(re.findall(r" ([-+*/]) ", " ".join(texts)))
+        self.assertEqual(used, set("+-*/"))
+        self.assertTrue(any("(" in text for text in texts))
+
+    def test_seed_repeats_expressions(self):
+        random.seed(5)
+        first = [expression() for _ in range(10)]
+        random.seed(5)
+        self.assertEqual([expression() for _ in range(10)], first)
+
+    def test_number_draws_every_digit(self):
+        random.seed(1)
+        counts = {}
+        for _ in range(10000):
+            digit = number()
+            counts[digit] = counts.get(digit, 0) + 1
+        self.assertEqual(sorted(counts), list("0123456789"))
+        # Redrawing past 9 keeps the digits even, a modulo would make 0 to 5
+        # twice as likely as the rest
+        for digit, count in counts.items():
+            self.assertLess(abs(count - 1000), 150, digit)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -1,4 +1,6 @@
-from graphviz import Digraph
+import os
+import subprocess
+import sys
 
 def calculate_value(x):
     if x < 5:  # Node 1
@@ -14,14 +16,39 @@ cfg = {
     'print i': ['i =+ 1']
 }
 
+def _quote(name):
+    # DOT ids are always quoted, with any double quote inside escaped
+    return '"' + name.replace('"', '\\"') + '"'
+
 def visualize_cfg(cfg):
-    dot = Digraph()
+    # Write the DOT source directly instead of going through graphviz.Digraph,
+    # the file is plain text and only needs the dot tool to be rendered
+    lines = ['digraph {\n']
     for node, edges in cfg.items():
-        dot.node(node, node)
+        source = _quote(node)
+        lines.append(f'\t{source} [label={source}]\n')
         for edge in edges:
-            dot.edge(node, edge)
-    return dot
+            lines.append(f'\t{source} -> {_quote(edge)}\n')
+    lines.append('}\n')
+    return ''.join(lines)
+
+def render(source, filename, view=False):
+    # Save the DOT source to filename and render it to filename.pdf, the same
+    # files Digraph.render produced
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(source)
+    pdf = filename + '.pdf'
+    subprocess.run(['dot', '-Tpdf', filename, '-o', pdf], check=True)
+    if view:
+        if sys.platform == 'win32':
+            os.startfile(pdf)
+        elif sys.platform == 'darwin':
+            subprocess.Popen(['open', pdf])
+        else:
+            subprocess.Popen(['xdg-open', pdf])
+    return pdf
 
-# 'cfg' is the Control Flow Graph we defined earlier
-dot = visualize_cfg(cfg)
-dot.render('cfg', view=True)
\ No newline at end of file
+if __name__ == '__main__':
+    # 'cfg' is the Control Flow Graph we defined earlier
+    source = visualize_cfg(cfg)
+    render(source, 'cfg', view=True)
\ No newline at end of file
@@ -1,28 +1,41 @@
 import random
 
-def expression(depth=0):
+# Operator pairs are fixed, so one random bit picks the operator
+_ADD_OPS = (" + ", " - ")
+_MUL_OPS = (" * ", " / ")
+
+def expression(depth=0, _g=random.getrandbits, _ops=_ADD_OPS):
     if depth > 3:  # Limit the depth to avoid deep recursion
         return number() # if reach the maximum depth, then just go to term with depth + 1
     else:
-        return term(depth+1) + random.choice([" + ", " - "]) + term(depth+1)
+        return term(depth+1) + _ops[_g(1)] + term(depth+1)
 
-def term(depth=0):
+def term(depth=0, _g=random.getrandbits, _ops=_MUL_OPS):
     if depth > 3:  # Further limit depth in term
         return number() # expression with depth more than 3 lead to this.
     else:
-        return factor(depth+1) + random.choice([" * ", " / "]) + factor(depth+1)
+        return factor(depth+1) + _ops[_g(1)] + factor(depth+1)
 
-def factor(depth=0):
+def factor(depth=0, _g=random.getrandbits):
     if depth > 3:  # Stop recursion by not allowing more expressions within factors
         return number() # term with depth more than 3 lead to this
     else:
-        return random.choice([str(number()), "(" + expression(depth+1) + ")"])
+        # Only build the side that is picked, a number or a nested expression
+        return number() if _g(1) else "(" + expression(depth+1) + ")"
+
+_DIGITS = "0123456789"
 
-def number():
-    return str(random.randint(0, 9))
+def number(_g=random.getrandbits):
+    # Four random bits give 0 to 15, redraw past 9 so every digit stays
+    # equally likely
+    d = _g(4)
+    while d > 9:
+        d = _g(4)
+    return _DIGITS[d]
 
 def digit():
-    return str(random.randint(0, 9))
+    return number()
 
-for _ in range(10):
-    print(expression())
\ No newline at end of file
+if __name__ == "__main__":
+    for _ in range(10):
+        print(expression())
\ No newline at end of file
@@ -0,0 +1,11 @@
+def match_parens(regex):
+    # Pair every '(' with its closing ')' in one pass, so the parser can
+    # jump straight to the end of a group instead of rescanning for it
+    matches = {}
+    stack = []
+    for k, char in enumerate(regex):
+        if char == '(':
+            stack.append(k)
+        elif char == ')' and stack:
+            matches[stack.pop()] = k
+    return matches
\ No newline at end of file
@@ -1,13 +1,9 @@
+# Characters that make a piece of the regex a rule rather than plain text
+_FORBIDDEN = frozenset("()*|")
+
 # This function used to check whether any rule in regex
 def check_rule(regex):
-    if "(" in regex:
-        return False
-    if ")" in regex:
-        return False
-    if "*" in regex:
-        return False
-    if "|" in regex:
-        return False
+    return _FORBIDDEN.isdisjoint(regex)
 
 # This function help to make a subexpression to handle nested parenthesis
 def make_Subexpression(index, termName):
@@ -18,41 +14,35 @@ def make_Subexpression(index, termName):
         return "<" + termName + "." + str(index) + ">"
 
 def split_String(regex):
+    # Every piece of the split is a contiguous slice of regex, so only the
+    # slice boundaries are tracked instead of growing a string char by char
     string_sublist = []
-    string = ""
+    start = 0
     brackCount = 0
     
     for i in range(0, len(regex)):
         char = regex[i]
         if char  == "(":
-            if (string != "" and brackCount == 0):
-                string_sublist.append(string)
-                string = ""
-            if (brackCount >= 1):
-                string = string + "("
+            if (i > start and brackCount == 0):
+                string_sublist.append(regex[start:i])
+            if (brackCount == 0):
+                start = i + 1
             brackCount += 1
         elif char == ")":
             brackCount -= 1
             if brackCount == 0:
-                string_sublist.append(string)
-                string = ""
-            else:
-                string = string + ")"
+                string_sublist.append(regex[start:i])
+                start = i + 1
         elif char == "|":
-            if brackCount == 0 and string != "":
-                string = string + "|"
-                string_sublist.append(string)
-                string = ""
-            elif string == "":
-                h = len(string) - 1
-                string_sublist[h] = "(" + string_sublist[h] + ")" + "|"
-            else:
-                string = string + char
-        else: 
-            string = string + char
+            if brackCount == 0 and i > start:
+                string_sublist.append(regex[start:i + 1])
+                start = i + 1
+            elif i == start:
+                string_sublist[-1] = f"({string_sublist[-1]})|"
+                start = i + 1
             
-        if (i == len(regex) - 1 and string != ""):
-            string_sublist.append(string)
+    if (len(regex) > start):
+        string_sublist.append(regex[start:])
     return string_sublist
     
 alphabet = []
@@ -60,52 +50,65 @@ grammar = {}
 index = 0
 
 def recursiveBuild (alphabet, grammar, regex, index, termName):
-    string_sublist = split_String(regex)
-    term = make_Subexpression(index, termName)
-    text = ""
-    
-    start = make_Subexpression(index, termName)
-    
-    if (len(string_sublist) != 1):
-        index += 1
-    
-    for i in range(0, len(string_sublist)):
-        text = string_sublist[i]
-        
-        if (len(string_sublist) != 1):
-            term = make_Subexpression(index, termName)
-            if (grammar.get(start) == None):
-                grammar.update({start: [term]})
-            else:
-                grammar.update({start: [grammar.get(start)[0] + term]})
+    # Starred groups that need rules of their own are built on an explicit
+    # stack of frames rather than by recursion. Each frame holds the start
+    # symbol of one (sub)expression and an iterator over its pieces still to
+    # be built, so a frame resumes where it left off once its child is done.
+    frames = []
+    pending = regex
+    while pending is not None:
+        string_sublist = split_String(pending)
+        start = make_Subexpression(index, termName)
+        multiple = len(string_sublist) != 1
+        if multiple:
+            index += 1
+        frames.append((start, multiple, iter(string_sublist)))
+        pending = None
         
-        if (text[-1] == "*"):
-            if check_rule(text[0:-1]):
-                if (len(text[0:-1] != 1)):
-                    text = text[0:-2] + make_Subexpression(index+1, termName)
-                    grammar.update({term: [text]})
-                    index += 1
+        while frames and pending is None:
+            start, multiple, pieces = frames[-1]
+            for piece in pieces:
+                term = start
+                text = piece
                 
-                term = make_Subexpression(index, termName)
-                text = string_sublist[i]
-                text = text + term
-                grammar.update({term: [text, ""]})
+                if multiple:
+                    term = make_Subexpression(index, termName)
+                    entry = grammar.get(start)
+                    grammar[start] = [term] if entry is None else [entry[0] + term]
                 
-                index += 1
+                if (text[-1] == "*"):
+                    # A bare "*" after a group has no letter to repeat
+                    if len(text) > 1 and check_rule(text[0:-1]):
+                        if (len(text[0:-1]) != 1):
+                            text = text[0:-2] + make_Subexpression(index+1, termName)
+                            grammar[term] = [text]
+                            index += 1
+                        
+                        term = make_Subexpression(index, termName)
+                        # The starred letter repeats itself through term
+                        text = piece[-2] + term
+                        grammar[term] = [text, ""]
+                        
+                        index += 1
+                    else:
+                        text = make_Subexpression(index +1, termName)
+                        text = text + term
+                        grammar[term] = [text, ""]
+                        text = piece
+                        index += 1
+                        # Build the group on a new frame before the next piece
+                        pending = text[0:-2]
+                        break
+                else:
+                    text = piece
+                    grammar[make_Subexpression(index, termName)] = [text]
+                    index += 1
             else:
-                text = make_Subexpression(index +1, termName)
-                text = text + term
-                grammar.update({term: [text, ""]})
-                text = string_sublist[i]
-                index += 1
-                index = recursiveBuild(alphabet, grammar, text[0:-2], index, termName)
-        else:
-            text = string_sublist[i]
-            grammar.update({make_Subexpression(index, termName): [text]})
-            index += 1
+                frames.pop()
     return index
 
-print("start")
-regex = input("Enter expression: ")
-recursiveBuild(alphabet, grammar, regex, 0, "term")
-print(grammar)
\ No newline at end of file
+if __name__ == "__main__":
+    print("start")
+    regex = input("Enter expression: ")
+    recursiveBuild(alphabet, grammar, regex, 0, "term")
+    print(grammar)
\ No newline at end of file
@@ -1,12 +1,12 @@
+from parens import match_parens
+
 def parse_regex_to_grammar(regex):
     # Initialize the alphabet and grammar dictionaries
     alphabet = set()
     grammar = {"<S>": []}
     
     def add_rule(symbol, production):
-        if symbol not in grammar:
-            grammar[symbol] = []
-        grammar[symbol].append(production)
+        grammar.setdefault(symbol, []).append(production)
     
     def parse_subexpression(subexp, index):
         # Each subexpression corresponds to a new non-terminal in the grammar
@@ -21,25 +21,20 @@ def parse_regex_to_grammar(regex):
         
         return non_terminal
     
+    n = len(regex)
+    matches = match_parens(regex)
     index = 0
     i = 0
-    while i < len(regex):
+    while i < n:
         if regex[i] == '(':
             # Find the matching closing parenthesis
-            depth = 1
-            j = i + 1
-            while j < len(regex) and depth > 0:
-                if regex[j] == '(':
-                    depth += 1
-                elif regex[j] == ')':
-                    depth -= 1
-                j += 1
+            j = matches[i] + 1 if i in matches else n
             # Recursive call for subexpression
             non_terminal = parse_subexpression(regex[i+1:j-1], index)
             index += 1
             
             # Handle Kleene star after subexpression
-            if j < len(regex) and regex[j] == '*':
+            if j < n and regex[j] == '*':
                 grammar["<S>"].append(non_terminal + "<S>")
                 grammar["<S>"].append("")  # Epsilon production for kleene star
                 j += 1  # Move past the kleene star
@@ -52,8 +47,9 @@ def parse_regex_to_grammar(regex):
     
     return sorted(alphabet), grammar
 
-# Example usage with the specific regex
-regex = input("Enter the expression: ")
-alphabet, grammar = parse_regex_to_grammar(regex)
-print("ALPHABET:", alphabet)
-print("GRAMMAR", grammar)
\ No newline at end of file
+if __name__ == "__main__":
+    # Example usage with the specific regex
+    regex = input("Enter the expression: ")
+    alphabet, grammar = parse_regex_to_grammar(regex)
+    print("ALPHABET:", alphabet)
+    print("GRAMMAR", grammar)
\ No newline at end of file
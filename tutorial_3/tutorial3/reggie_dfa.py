@@ -0,0 +1,107 @@
+import pickle
+import re
+from array import array
+
+# State 0 is the dead state every missing transition goes to, matching
+# always starts from state 1
+DEAD = 0
+START = 1
+
+# A production is read as non-terminals like <S> or <term.1> and single
+# terminal characters, an empty production is epsilon
+_SYMBOL = re.compile(r"<[^<>]*>|.", re.DOTALL)
+
+# Terminals and matched text are both taken as UTF-8 bytes. surrogatepass
+# lets every str encode, so no grammar or text is refused for its characters.
+def _encode(text):
+    return text.encode("utf-8", "surrogatepass")
+
+def _split_production(production, grammar):
+    symbols = []
+    for symbol in _SYMBOL.findall(production):
+        if symbol in grammar:
+            symbols.append(symbol)
+        else:
+            # A character past ASCII becomes a run of byte transitions, and
+            # text in angle brackets that names no rule is just terminals
+            symbols.extend(_encode(symbol))
+    return tuple(symbols)
+
+# Expand non-terminals at the front of each configuration until every
+# configuration starts with a terminal byte or is empty (accepting). A
+# configuration is the tuple of symbols still to be matched.
+def _closure(configs, grammar, productions, limit):
+    seen = set()
+    todo = list(configs)
+    while todo:
+        config = todo.pop()
+        if config in seen:
+            continue
+        seen.add(config)
+        if config and config[0] in grammar:
+            for production in productions[config[0]]:
+                expanded = production + config[1:]
+                if len(expanded) > limit:
+                    raise ValueError("left or self nesting of " + config[0]
+                                     + " is not supported")
+                todo.append(expanded)
+    return frozenset(c for c in seen if not c or c[0] not in grammar)
+
+# Turn a grammar into a table-driven DFA by subset construction. The table is
+# a flat array where table[state * 256 + byte] is the next state, so matching
+# is one index per byte of the UTF-8 encoded text. Grammars where a
+# non-terminal appears again before its own production ends (left recursion
+# or nesting like a<S>b) are rejected with ValueError, even when they are
+# regular.
+def compile_grammar(grammar, start="<S>"):
+    if start not in grammar:
+        raise KeyError(start)
+    productions = {symbol: [_split_production(p, grammar) for p in rules]
+                   for symbol, rules in grammar.items()}
+    longest = max((len(p) for rules in productions.values() for p in rules),
+                  default=0)
+    # Without self nesting every non-terminal adds at most one production to
+    # a configuration, so anything longer can only grow forever
+    limit = (len(grammar) + 1) * max(longest, 1)
+
+    first = _closure([(start,)], grammar, productions, limit)
+    states = {first: START}
+    order = [first]
+    table = array("i", [DEAD] * 256 * 2)
+    accept = bytearray(2)
+    accept[START] = () in first
+
+    i = 0
+    while i < len(order):
+        state = order[i]
+        moves = {}
+        for config in state:
+            if config:
+                moves.setdefault(config[0], []).append(config[1:])
+        for byte, configs in moves.items():
+            target = _closure(configs, grammar, productions, limit)
+            if target not in states:
+                states[target] = len(order) + 1
+                order.append(target)
+                table.extend([DEAD] * 256)
+                accept.append(() in target)
+            table[states[state] * 256 + byte] = states[target]
+        i += 1
+    return table, bytes(accept)
+
+# Run text through a table built by compile_grammar
+def match(table, accept, text):
+    state = START
+    for byte in _encode(text):
+        state = table[state * 256 + byte]
+        if state == DEAD:
+            return False
+    return bool(accept[state])
+
+if __name__ == "__main__":
+    # Load the (alphabet, grammar) pair written by reggie_submisison.py
+    with open("grammar.pkl", "rb") as infile:
+        alphabet, grammar = pickle.load(infile)
+    table, accept = compile_grammar(grammar)
+    text = input("Enter a string to match: ")
+    print("Match:", match(table, accept, text))
\ No newline at end of file
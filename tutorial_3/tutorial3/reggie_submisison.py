@@ -1,5 +1,18 @@
 import pickle
+
+from parens import match_parens
    
+# Character classes for the parser, looked up by the byte value of a character
+_OTHER, _ALPHA, _STAR, _PIPE, _OPEN = range(5)
+_CLASS = bytes(
+    _ALPHA if chr(c).isalpha() else
+    _STAR if chr(c) == '*' else
+    _PIPE if chr(c) == '|' else
+    _OPEN if chr(c) == '(' else
+    _OTHER
+    for c in range(256)
+)
+
 def parse_regex_to_grammar(regex):
     alphabet = set(filter(str.isalpha, regex))
     grammar = {"<S>": []}
@@ -13,33 +26,31 @@ def parse_regex_to_grammar(regex):
     # This will hold all subexpressions for alternation
     subexpressions = []
 
+    # Characters outside latin-1 become '?' so every index still has a class
+    codes = regex.encode('latin-1', 'replace')
+    n = len(regex)
+    matches = match_parens(regex)
     i = 0
-    while i < len(regex):
-        if regex[i].isalpha():
-            alphabet.add(regex[i])
-            if i + 1 < len(regex) and regex[i + 1] == '*':
-                subexpressions.append(kleene_non_terminal(regex[i]))
+    while i < n:
+        kind = _CLASS[codes[i]]
+        c = regex[i]
+        # Letters past latin-1 are all '?' in codes, so ask str.isalpha
+        if kind == _ALPHA or (kind == _OTHER and c > '\xff' and c.isalpha()):
+            alphabet.add(c)
+            if i + 1 < n and _CLASS[codes[i + 1]] == _STAR:
+                subexpressions.append(kleene_non_terminal(c))
                 i += 1  # Skip the '*' character
             else:
-                subexpressions.append(regex[i])
+                subexpressions.append(c)
         # This is to handle the Union part
-        elif regex[i] == '|':
+        elif kind == _PIPE:
             if subexpressions:
                 grammar["<S>"].append("".join(subexpressions))
                 subexpressions = []
                 
-        elif regex[i] == '(':
+        elif kind == _OPEN:
             # Find the matching closing parenthesis
-            j = i
-            depth = 0
-            while j < len(regex):
-                if regex[j] == '(':
-                    depth += 1
-                elif regex[j] == ')':
-                    depth -= 1
-                    if depth == 0:
-                        break
-                j += 1
+            j = matches.get(i, n)
             
             # Handle the subexpression recursively
             subexpr = regex[i+1:j]
@@ -54,7 +65,7 @@ def parse_regex_to_grammar(regex):
 
             # If the entire subexpression is followed by a kleene star,
             # add the recursive part to <S>, but not to sub_nt
-            if j + 1 < len(regex) and regex[j + 1] == '*':
+            if j + 1 < n and _CLASS[codes[j + 1]] == _STAR:
                 grammar["<S>"].append(sub_nt + "<S>")  # Recursive part
                 grammar["<S>"].append("")  # Epsilon part for <S>
                 i = j + 1  # Skip the '*' character
@@ -70,17 +81,18 @@ def parse_regex_to_grammar(regex):
     
     return sorted(list(alphabet)), grammar
 
-# Read regular expression from standard input
-regex_input = input("Enter the regular expression: ")
+if __name__ == "__main__":
+    # Read regular expression from standard input
+    regex_input = input("Enter the regular expression: ")
 
-# Parse and generate the grammar
-alphabet, grammar = parse_regex_to_grammar(regex_input)
+    # Parse and generate the grammar
+    alphabet, grammar = parse_regex_to_grammar(regex_input)
 
-# Output the alphabet and grammar to a pickle file
-# output = (alphabet, grammar)
-# with open('grammar.pkl', 'wb') as outfile:
-#     pickle.dump(output, outfile)
+    # Output the alphabet and grammar to a pickle file
+    # output = (alphabet, grammar)
+    # with open('grammar.pkl', 'wb') as outfile:
+    #     pickle.dump(output, outfile)
 
-# For testing purposes: print the alphabet and grammar
-print("Alphabet:", alphabet)
-print("Grammar:", grammar)
\ No newline at end of file
+    # For testing purposes: print the alphabet and grammar
+    print("Alphabet:", alphabet)
+    print("Grammar:", grammar)
\ No newline at end of file
@@ -0,0 +1,49 @@
+import unittest
+
+from reggie import recursiveBuild, split_String
+
+
+class SplitStringTest(unittest.TestCase):
+    def test_splits_groups_and_unions(self):
+        self.assertEqual(split_String("a(b|c)d"), ["a", "b|c", "d"])
+        self.assertEqual(split_String("ab|c"), ["ab|", "c"])
+        self.assertEqual(split_String("(ab)|c"), ["(ab)|", "c"])
+
+    def test_stray_closing_parenthesis_keeps_text(self):
+        self.assertEqual(split_String("a)b(c)"), ["a)b(c)"])
+        self.assertEqual(split_String("x)(y|)|z"), ["x)(y|", ")|z"])
+
+
+class RecursiveBuildTest(unittest.TestCase):
+    def build(self, regex):
+        grammar = {}
+        recursiveBuild([], grammar, regex, 0, "term")
+        return grammar
+
+    def test_starred_letter(self):
+        self.assertEqual(self.build("a*"), {"<S>": ["a<S>", ""]})
+
+    def test_starred_last_letter(self):
+        self.assertEqual(self.build("ab*"), {
+            "<S>": ["a<term.1>"],
+            "<term.1>": ["b<term.1>", ""],
+        })
+
+    def test_starred_group(self):
+        # Pins the original script's output, which is not a complete
+        # grammar: the group is split off as <term.1>, so the star repeats
+        # a <term.3> that never gets a rule
+        self.assertEqual(self.build("(a|b)*"), {
+            "<S>": ["<term.1><term.2>"],
+            "<term.1>": ["a|b"],
+            "<term.2>": ["<term.3><term.2>", ""],
+        })
+
+    def test_extends_existing_start_production(self):
+        grammar = {"<S>": ["x"]}
+        recursiveBuild([], grammar, "(a)(b)", 0, "term")
+        self.assertEqual(grammar["<S>"], ["x<term.1><term.2>"])
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,152 @@
+import itertools
+import random
+import unittest
+
+import reggie
+import reggie_bug
+import reggie_submisison
+from reggie_dfa import _SYMBOL, compile_grammar, match
+
+
+# Read a production as non-terminals and single characters. The recognizer
+# below works on characters, while compile_grammar works on UTF-8 bytes.
+def split(production, grammar):
+    symbols = []
+    for symbol in _SYMBOL.findall(production):
+        symbols.extend([symbol] if symbol in grammar else symbol)
+    return tuple(symbols)
+
+
+def split_all(grammar):
+    return {symbol: [split(p, grammar) for p in rules]
+            for symbol, rules in grammar.items()}
+
+
+# Brute-force recognizer: search every leftmost derivation of text, bounded
+# by the number of terminals left to match
+def derives(grammar, text, start="<S>"):
+    productions = split_all(grammar)
+    active = set()
+
+    def search(symbols, pos):
+        if not symbols:
+            return pos == len(text)
+        terminals = sum(1 for s in symbols if s not in grammar)
+        if terminals > len(text) - pos or (symbols, pos) in active:
+            return False
+        head, rest = symbols[0], symbols[1:]
+        if head not in grammar:
+            return text.startswith(head, pos) and search(rest, pos + 1)
+        active.add((symbols, pos))
+        try:
+            return any(search(p + rest, pos) for p in productions[head])
+        finally:
+            active.discard((symbols, pos))
+
+    return search((start,), 0)
+
+
+def terminals(grammar):
+    found = set()
+    for rules in grammar.values():
+        for rule in rules:
+            found.update(s for s in split(rule, grammar)
+                         if s not in grammar)
+    return sorted(found)
+
+
+# Random derivations of the grammar, to cover words longer than the
+# brute-force enumeration reaches
+def samples(grammar, count=30, start="<S>"):
+    rng = random.Random(0)
+    productions = split_all(grammar)
+    words = set()
+    for _ in range(count):
+        symbols, out = [start], []
+        for _ in range(200):
+            if not symbols:
+                words.add("".join(out))
+                break
+            head = symbols.pop(0)
+            if head in grammar:
+                symbols[:0] = rng.choice(productions[head])
+            else:
+                out.append(head)
+    return sorted(words)
+
+
+def reggie_grammar(regex):
+    grammar = {}
+    reggie.recursiveBuild([], grammar, regex, 0, "term")
+    return grammar
+
+
+class CompileGrammarTest(unittest.TestCase):
+    def assert_same_language(self, grammar, max_length=5, max_words=2000):
+        table, accept = compile_grammar(grammar)
+        letters = terminals(grammar) + ["z"]
+        length = 0
+        while length <= max_length and len(letters) ** length <= max_words:
+            for word in itertools.product(letters, repeat=length):
+                text = "".join(word)
+                with self.subTest(grammar=grammar, text=text):
+                    self.assertEqual(match(table, accept, text),
+                                     derives(grammar, text))
+            length += 1
+        for text in samples(grammar):
+            with self.subTest(grammar=grammar, text=text):
+                self.assertTrue(match(table, accept, text))
+                self.assertEqual(match(table, accept, text + text),
+                                 derives(grammar, text + text))
+
+    def test_reggie_submisison_grammars(self):
+        for regex in ["ab", "a*b", "(a|b)*", "ab|c", "a(b|c)d", "ab*|ba*",
+                      "x(y)*z"]:
+            self.assert_same_language(
+                reggie_submisison.parse_regex_to_grammar(regex)[1])
+
+    def test_reggie_bug_grammars(self):
+        for regex in ["(a|b)*", "(ab)(c)", "(a)*(b|c)"]:
+            self.assert_same_language(
+                reggie_bug.parse_regex_to_grammar(regex)[1])
+
+    def test_reggie_grammars(self):
+        for regex in ["a*", "ab*", "a(b|c)d", "(a|b)*", "abc|(de)*"]:
+            self.assert_same_language(reggie_grammar(regex))
+
+    def test_letters_past_ascii(self):
+        # 'é' and 'ê' share their first UTF-8 byte, '日' and '本' take three
+        for regex in ["é|ê*", "日本", "(αβ)*γ|δ", "x(日)*本|ß*"]:
+            self.assert_same_language(
+                reggie_submisison.parse_regex_to_grammar(regex)[1])
+
+    def test_matches_examples(self):
+        table, accept = compile_grammar(
+            reggie_submisison.parse_regex_to_grammar("a*b")[1])
+        self.assertTrue(match(table, accept, "aab"))
+        self.assertTrue(match(table, accept, "b"))
+        self.assertFalse(match(table, accept, "aba"))
+        self.assertFalse(match(table, accept, "日"))
+        self.assertFalse(match(table, accept, "\ud800"))
+        table, accept = compile_grammar(
+            reggie_submisison.parse_regex_to_grammar("日本*")[1])
+        self.assertTrue(match(table, accept, "日"))
+        self.assertTrue(match(table, accept, "日本本"))
+        self.assertFalse(match(table, accept, "本"))
+        # '末' differs from '本' only in its last byte
+        self.assertFalse(match(table, accept, "日末"))
+
+    def test_rejects_self_nesting(self):
+        for grammar in [{"<S>": ["a<S>b", ""]},
+                        {"<S>": ["<A>a", ""], "<A>": ["<A>b", ""]}]:
+            with self.subTest(grammar=grammar):
+                with self.assertRaisesRegex(ValueError, "is not supported"):
+                    compile_grammar(grammar)
+
+    def test_missing_start_symbol(self):
+        with self.assertRaises(KeyError):
+            compile_grammar({"<A>": ["a"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
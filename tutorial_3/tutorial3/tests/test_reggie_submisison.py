@@ -0,0 +1,35 @@
+import unittest
+
+from reggie_submisison import parse_regex_to_grammar
+
+
+class ParseRegexToGrammarTest(unittest.TestCase):
+    def test_groups_and_unions(self):
+        self.assertEqual(parse_regex_to_grammar("(a|b)*"), (
+            ["a", "b"],
+            {"<S>": ["<SUB0><S>", ""], "<SUB0>": ["a", "b"]},
+        ))
+
+    def test_letters_outside_latin1(self):
+        self.assertEqual(parse_regex_to_grammar("(αβ)γ|δ"), (
+            ["α", "β", "γ", "δ"],
+            {"<S>": ["<SUB0>", "δ"], "<SUB0>": ["αβ"]},
+        ))
+        self.assertEqual(parse_regex_to_grammar("x(日)*本|ß*"), (
+            ["x", "ß", "日", "本"],
+            {
+                "<S>": ["<SUB1><S>", "", "x本", "<SS>"],
+                "<SUB1>": ["日"],
+                "<SS>": ["ß<SS>", ""],
+            },
+        ))
+
+    def test_non_letters_are_skipped(self):
+        self.assertEqual(parse_regex_to_grammar("a²①*b|"), (
+            ["a", "b"],
+            {"<S>": ["ab"]},
+        ))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file